@@ -10,6 +10,28 @@ from haystack.components.audio import LocalWhisperTranscriber
 
 
 SAMPLES_PATH = Path(__file__).parent.parent.parent / "test_files"
+AUDIO_FILE = SAMPLES_PATH / "audio" / "this is the content of the document.wav"
+
+
+@pytest.fixture
+def mocked_transcriber():
+    """
+    A transcriber whose model is replaced by a MagicMock returning a fixed transcription.
+    """
+    comp = LocalWhisperTranscriber(model_name_or_path="large-v2")
+    comp._model = MagicMock()
+    comp._model.transcribe.return_value = {"text": "test transcription", "other_metadata": ["other", "meta", "data"]}
+    return comp
+
+
+@pytest.fixture(scope="session")
+def warmed_whisper():
+    """
+    Loads the "medium" Whisper model once for all the integration tests.
+    """
+    comp = LocalWhisperTranscriber(model_name_or_path="medium", whisper_params={"language": "english"})
+    comp.warm_up()
+    return comp
 
 
 class TestLocalWhisperTranscriber:
@@ -63,69 +85,29 @@ class TestLocalWhisperTranscriber:
             transcriber.warm_up()
             mocked_whisper.load_model.assert_called_once()
 
-    def test_run_with_path(self):
-        comp = LocalWhisperTranscriber(model_name_or_path="large-v2")
-        comp._model = MagicMock()
-        comp._model.transcribe.return_value = {
-            "text": "test transcription",
-            "other_metadata": ["other", "meta", "data"],
-        }
-        results = comp.run(audio_files=[SAMPLES_PATH / "audio" / "this is the content of the document.wav"])
-        expected = Document(
-            content="test transcription",
-            meta={
-                "audio_file": SAMPLES_PATH / "audio" / "this is the content of the document.wav",
-                "other_metadata": ["other", "meta", "data"],
-            },
-        )
-        assert results["documents"] == [expected]
-
-    def test_run_with_str(self):
-        comp = LocalWhisperTranscriber(model_name_or_path="large-v2")
-        comp._model = MagicMock()
-        comp._model.transcribe.return_value = {
-            "text": "test transcription",
-            "other_metadata": ["other", "meta", "data"],
-        }
-        results = comp.run(
-            audio_files=[str((SAMPLES_PATH / "audio" / "this is the content of the document.wav").absolute())]
-        )
+    @pytest.mark.parametrize(
+        "audio_file, expected_audio_file",
+        [(AUDIO_FILE, AUDIO_FILE), (str(AUDIO_FILE.absolute()), str(AUDIO_FILE.absolute()))],
+        ids=["path", "str"],
+    )
+    def test_run(self, mocked_transcriber, audio_file, expected_audio_file):
+        results = mocked_transcriber.run(audio_files=[audio_file])
         expected = Document(
             content="test transcription",
-            meta={
-                "audio_file": str((SAMPLES_PATH / "audio" / "this is the content of the document.wav").absolute()),
-                "other_metadata": ["other", "meta", "data"],
-            },
+            meta={"audio_file": expected_audio_file, "other_metadata": ["other", "meta", "data"]},
         )
         assert results["documents"] == [expected]
 
-    def test_transcribe(self):
-        comp = LocalWhisperTranscriber(model_name_or_path="large-v2")
-        comp._model = MagicMock()
-        comp._model.transcribe.return_value = {
-            "text": "test transcription",
-            "other_metadata": ["other", "meta", "data"],
-        }
-        results = comp.transcribe(audio_files=[SAMPLES_PATH / "audio" / "this is the content of the document.wav"])
+    def test_transcribe(self, mocked_transcriber):
+        results = mocked_transcriber.transcribe(audio_files=[AUDIO_FILE])
         expected = Document(
-            content="test transcription",
-            meta={
-                "audio_file": SAMPLES_PATH / "audio" / "this is the content of the document.wav",
-                "other_metadata": ["other", "meta", "data"],
-            },
+            content="test transcription", meta={"audio_file": AUDIO_FILE, "other_metadata": ["other", "meta", "data"]}
         )
         assert results == [expected]
 
-    def test_transcribe_stream(self):
-        comp = LocalWhisperTranscriber(model_name_or_path="large-v2")
-        comp._model = MagicMock()
-        comp._model.transcribe.return_value = {
-            "text": "test transcription",
-            "other_metadata": ["other", "meta", "data"],
-        }
-        results = comp.transcribe(
-            audio_files=[open(SAMPLES_PATH / "audio" / "this is the content of the document.wav", "rb")]
-        )
+    def test_transcribe_stream(self, mocked_transcriber):
+        with open(AUDIO_FILE, "rb") as audio_stream:
+            results = mocked_transcriber.transcribe(audio_files=[audio_stream])
         expected = Document(
             content="test transcription",
             meta={"audio_file": "<<binary stream>>", "other_metadata": ["other", "meta", "data"]},
@@ -134,16 +116,15 @@ class TestLocalWhisperTranscriber:
 
     @pytest.mark.integration
     @pytest.mark.skipif(sys.platform in ["win32", "cygwin"], reason="ffmpeg not installed on Windows CI")
-    def test_whisper_local_transcriber(self, test_files_path):
-        comp = LocalWhisperTranscriber(model_name_or_path="medium", whisper_params={"language": "english"})
-        comp.warm_up()
-        output = comp.run(
-            audio_files=[
-                test_files_path / "audio" / "this is the content of the document.wav",
-                str((test_files_path / "audio" / "the context for this answer is here.wav").absolute()),
-                open(test_files_path / "audio" / "answer.wav", "rb"),
-            ]
-        )
+    def test_whisper_local_transcriber(self, warmed_whisper, test_files_path):
+        with open(test_files_path / "audio" / "answer.wav", "rb") as audio_stream:
+            output = warmed_whisper.run(
+                audio_files=[
+                    test_files_path / "audio" / "this is the content of the document.wav",
+                    str((test_files_path / "audio" / "the context for this answer is here.wav").absolute()),
+                    audio_stream,
+                ]
+            )
         docs = output["documents"]
         assert len(docs) == 3
 